@@ -1,9 +1,11 @@
+import json
 import logging
 import subprocess
 import vertexai
 from vertexai.generative_models import GenerativeModel
 import yaml
 from pathlib import Path
+from router import PromptRouter
 
 # --- Configuration ---
 # IMPORTANT: You must replace these with your actual project details.
@@ -12,8 +14,9 @@ GCP_LOCATION = "us-central1"
 GEMMA_MODEL_NAME = "gemma-2b"
 
 class SascOrchestrator:
-    def __init__(self, host_config):
+    def __init__(self, host_config, router=None):
         self.host_config = host_config
+        self.router = router
         self.logger = self._setup_logger()
         self._initialize_vertex_ai()
         self.logger.info(f"THOUGHT: Orchestrator initialized on host: {self.host_config.get('DEVICE')}")
@@ -53,7 +56,11 @@ class SascOrchestrator:
 
     def process_input(self, user_input):
         if not user_input.startswith('!'):
-            self.invoke_gemma_model(user_input)
+            tool = self.router.route(user_input) if self.router else None
+            if tool:
+                self.dispatch_tool(tool, user_input)
+            else:
+                self.invoke_gemma_model(user_input)
             return
 
         parts = user_input[1:].split()
@@ -68,9 +75,30 @@ class SascOrchestrator:
             self.launch_agent(args)
         elif command == "qwen":
             self.invoke_qwen_local_mock(" ".join(args))
+        elif command == "router":
+            self.show_router_stats()
         else:
             print(f"Unknown command: {command}")
 
+    def dispatch_tool(self, tool, prompt):
+        self.logger.info(f"THOUGHT: Local router matched prompt to tool '{tool}'. Skipping Gemma.")
+        tool_call = {"type": "TOOL_CALL", "payload": tool, "prompt": prompt}
+        print("\n--- Local Router Dispatch ---")
+        print(json.dumps(tool_call, indent=2))
+        print("-----------------------------\n")
+
+    def show_router_stats(self):
+        if not self.router:
+            print("Local router is not loaded.")
+            return
+        stats = self.router.stats()
+        print("\nLocal Router Stats:")
+        print(f"  Rules compiled:   {stats['rules']}")
+        print(f"  Hits / Misses:    {stats['hits']} / {stats['misses']}")
+        print(f"  Hit rate:         {stats['hit_rate']:.1%}")
+        print(f"  Avg route time:   {stats['avg_route_us']:.2f} us")
+        print("")
+
     def invoke_gemma_model(self, prompt):
         self.logger.info(f"THOUGHT: Received natural language prompt. Invoking Gemma on Vertex AI.")
         if not self.gemma_model:
@@ -129,7 +157,8 @@ def sort_and_filter(data, filter_threshold=10):
         print("  !exit / !quit      - Exit the orchestrator.")
         print("  !launch_agent      - Launch a simulated native agent (Workforce Layer).")
         print("  !qwen <prompt>     - Send a prompt to the local Qwen-Coder model (mock).")
-        print("  <prompt>           - Send a natural language prompt to Gemma on Vertex AI.")
+        print("  !router            - Show local router hit-rate metrics.")
+        print("  <prompt>           - Dispatch to a tool via the local router, or send to Gemma on Vertex AI.")
         print("")
 
 if __name__ == "__main__":
@@ -147,5 +176,5 @@ if __name__ == "__main__":
         print("AARCH64_HOST_CONFIG not found in manifest.")
         exit(1)
 
-    orchestrator = SascOrchestrator(host_config)
+    orchestrator = SascOrchestrator(host_config, router=PromptRouter.from_manifest(scm))
     orchestrator.run()
\ No newline at end of file
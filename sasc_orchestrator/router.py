@@ -0,0 +1,124 @@
+import json
+import re
+import time
+from collections import deque
+
+# Matches the `if (userPrompt.includes("...")) { return { type: "TOOL_CALL", payload: "..." }; }`
+# branches of api/frontend/api_router.ts.
+ROUTER_RULE_PATTERN = re.compile(
+    r'userPrompt\.includes\(\s*"([^"]+)"\s*\)\s*\)\s*\{\s*return\s*\{\s*type:\s*"TOOL_CALL",\s*payload:\s*"([^"]+)"'
+)
+
+WORD_CHAR = re.compile(r"[a-z0-9_]")
+
+
+class PromptRouter:
+    """
+    Local fast-path router compiled from the manifest's routing rules.
+
+    Keywords from api/frontend/api_router.ts and the tool names listed in
+    config/tool_registry.json `active_tools` are compiled into a single
+    Aho-Corasick automaton, so a prompt is routed in one pass over its text.
+    A miss means the prompt should fall back to the LLM.
+
+    api_router.ts keywords keep the substring semantics of `includes()`; tool
+    names only match as whole words, so "analyze_networking" does not route to
+    analyze_network. Unlike the case-sensitive TS `includes()`, all matching is
+    case-insensitive.
+    """
+
+    def __init__(self, rules):
+        # rules: ordered (keyword, tool, whole_word) triples; earlier rules win when several match.
+        self.rules = [(keyword.lower(), tool, whole_word) for keyword, tool, whole_word in rules]
+        self.hits = 0
+        self.misses = 0
+        self.total_route_ns = 0
+        self._compile()
+
+    @classmethod
+    def from_manifest(cls, scm):
+        filesystem = scm.get("SASC_AGENT_MANIFEST", {}).get("PROJECT_FILESYSTEM", {})
+        rules = [
+            (keyword, tool, False)
+            for keyword, tool in ROUTER_RULE_PATTERN.findall(filesystem.get("api/frontend/api_router.ts", ""))
+        ]
+
+        try:
+            registry = json.loads(filesystem.get("config/tool_registry.json", "{}"))
+        except json.JSONDecodeError:
+            registry = {}
+        for tool in registry.get("active_tools", []):
+            rules.append((tool, tool, True))
+            if "_" in tool:
+                rules.append((tool.replace("_", " "), tool, True))
+        return cls(rules)
+
+    def _compile(self):
+        # Trie: goto[state] maps a character to the next state; output[state]
+        # lists the indices of every rule ending at that state.
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for priority, (keyword, _, _) in enumerate(self.rules):
+            state = 0
+            for char in keyword:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].append(priority)
+
+        # Breadth-first pass to fill in failure links and merge outputs.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def route(self, prompt):
+        """Returns the tool name for the prompt, or None if it should go to the LLM."""
+        start = time.perf_counter_ns()
+        text = prompt.lower()
+        best = None
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for priority in self._output[state]:
+                if best is not None and priority >= best:
+                    continue
+                keyword, _, whole_word = self.rules[priority]
+                if whole_word and not self._is_word_boundary(text, end - len(keyword) + 1, end + 1):
+                    continue
+                best = priority
+        self.total_route_ns += time.perf_counter_ns() - start
+
+        if best is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.rules[best][1]
+
+    @staticmethod
+    def _is_word_boundary(text, start, end):
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        return not (WORD_CHAR.match(before) or WORD_CHAR.match(after))
+
+    def stats(self):
+        routed = self.hits + self.misses
+        return {
+            "rules": len(self.rules),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / routed if routed else 0.0,
+            "avg_route_us": self.total_route_ns / routed / 1000 if routed else 0.0,
+        }
@@ -0,0 +1,118 @@
+"""
+Thin sascctl client.
+
+This is the console entry point. It deliberately imports nothing heavier than
+the standard library: when a `sascctl serve` daemon is listening, the command
+is forwarded over its Unix socket and the cold typer/manifest start is skipped.
+Otherwise it falls back to running the full CLI in-process.
+"""
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+
+def _default_socket_path() -> Path:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "sascctl.sock"
+    # No per-user runtime dir: use a private directory, see ensure_socket_dir().
+    return Path(f"/tmp/sascctl-{os.getuid()}") / "sascctl.sock"
+
+
+DEFAULT_SOCKET_PATH = Path(os.environ["SASCCTL_SOCKET"]) if os.environ.get("SASCCTL_SOCKET") else _default_socket_path()
+
+# Commands the daemon serves. Everything else (init, serve, --help) runs locally.
+FORWARDED_COMMANDS = {"compile", "inject", "commit", "launch-agent"}
+
+
+def owned_by_caller(path: Path) -> bool:
+    """True if path exists and belongs to the current user (symlinks are not followed)."""
+    try:
+        return os.lstat(path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def ensure_socket_dir(socket_path: Path):
+    """
+    Creates the socket's parent directory as a private (0700) directory.
+    Raises PermissionError if it exists but is not private to the current user.
+    """
+    directory = socket_path.parent
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    stat = os.lstat(directory)
+    if directory.is_symlink() or stat.st_uid != os.getuid():
+        raise PermissionError(f"Socket directory is not owned by the current user: {directory}")
+    # XDG_RUNTIME_DIR is already 0700; only our own fallback directory must be private.
+    if not os.environ.get("XDG_RUNTIME_DIR") and stat.st_mode & 0o077:
+        raise PermissionError(f"Socket directory is accessible to other users: {directory}")
+
+
+def _connect(socket_path: Path) -> socket.socket:
+    if not owned_by_caller(socket_path):
+        raise PermissionError(f"Socket is missing or not owned by the current user: {socket_path}")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(sock: socket.socket, request: dict) -> dict:
+    with sock:
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def ping_daemon(socket_path: Path = DEFAULT_SOCKET_PATH) -> bool:
+    """Returns True if a daemon owned by the current user is accepting requests on socket_path."""
+    try:
+        return _exchange(_connect(socket_path), {"ping": True}).get("exit_code") == 0
+    except (OSError, ValueError):
+        return False
+
+
+def request_daemon(argv, socket_path: Path = DEFAULT_SOCKET_PATH, cwd: str = None) -> dict:
+    """
+    Runs a sascctl command line in the daemon.
+
+    Relative paths in argv are resolved against cwd (the caller's working directory
+    by default). Returns {"stdout": ..., "stderr": ..., "exit_code": ...}.
+    Raises OSError if no daemon is listening.
+    """
+    return _exchange(_connect(socket_path), {"argv": list(argv), "cwd": cwd or os.getcwd()})
+
+
+def main():
+    argv = sys.argv[1:]
+    if argv and argv[0] in FORWARDED_COMMANDS and not os.environ.get("SASCCTL_NO_DAEMON"):
+        try:
+            sock = _connect(DEFAULT_SOCKET_PATH)
+        except OSError:
+            # No daemon (or a stale/foreign socket): run locally instead.
+            sock = None
+        if sock is not None:
+            # The request may already be running in the daemon, so never retry it locally.
+            try:
+                response = _exchange(sock, {"argv": argv, "cwd": os.getcwd()})
+            except (OSError, ValueError) as e:
+                sys.stderr.write(f"Lost connection to the sascctl daemon; the command may have partially run: {e}\n")
+                sys.exit(1)
+            sys.stdout.write(response["stdout"])
+            sys.stdout.flush()
+            sys.stderr.write(response["stderr"])
+            sys.stderr.flush()
+            sys.exit(response["exit_code"])
+
+    from sascctl.main import app
+    app(prog_name="sascctl")
+
+
+if __name__ == "__main__":
+    main()
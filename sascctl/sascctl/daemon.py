@@ -0,0 +1,154 @@
+"""
+Resident sascctl daemon.
+
+Serves sascctl command lines over a Unix socket using newline-delimited JSON
+(see sascctl.client). Parsed manifests and compiled boot images stay warm in
+sascctl.main's state cache between requests; a watcher thread evicts entries
+whose backing file changed so edits to the manifest are picked up.
+"""
+import contextlib
+import io
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from sascctl.client import FORWARDED_COMMANDS
+import sascctl.main
+from sascctl.main import _STATE_CACHE, _cached, _encode_boot_image, _load_manifest, app
+
+
+class SascctlRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            response = {"exit_code": 1, "stdout": "", "stderr": "Malformed request.\n"}
+        else:
+            if request.get("ping"):
+                response = {"exit_code": 0, "stdout": "", "stderr": ""}
+            else:
+                response = self.server.execute(request.get("argv", []), request.get("cwd", os.getcwd()))
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class SascctlDaemon(socketserver.ThreadingUnixStreamServer):
+    """
+    Accepts clients concurrently, one thread per connection. Command execution is
+    serialized: commands chdir into the client's working directory, capture stdout
+    and stderr, and write shared files such as the boot image. Agent simulator
+    subprocesses are run after the lock is released.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, manifest_path: Path, poll_interval: float = 1.0):
+        self.socket_path = Path(socket_path)
+        self.manifest_path = Path(manifest_path).resolve()
+        self.poll_interval = poll_interval
+        # Commands redirect sys.stdout/sys.stderr while they run; daemon logging keeps the real stream.
+        self._log = sys.stdout
+        self._execute_lock = threading.Lock()
+        self._stopped = threading.Event()
+        # Create the socket as 0600 from the start instead of tightening it after bind().
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), SascctlRequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+        self.warm()
+        self._watcher = threading.Thread(target=self._watch, name="sascctl-manifest-watcher", daemon=True)
+        self._watcher.start()
+
+    def warm(self):
+        """Loads the manifest and its compiled boot image into the state cache."""
+        if not self.manifest_path.exists():
+            return
+        with self._execute_lock:
+            _load_manifest(self.manifest_path)
+            _cached(self.manifest_path, "boot_image", lambda p: _encode_boot_image(p.read_bytes()))
+
+    def _watch(self):
+        while not self._stopped.wait(self.poll_interval):
+            stale = []
+            for key, (stamp, _) in list(_STATE_CACHE.items()):
+                try:
+                    stat = os.stat(key[0])
+                    current = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    current = None
+                if current != stamp:
+                    stale.append(key)
+            if not stale:
+                continue
+            with self._execute_lock:
+                for key in stale:
+                    _STATE_CACHE.pop(key, None)
+            print(f"♻️  Invalidated {len(stale)} cached state entr{'y' if len(stale) == 1 else 'ies'}: "
+                  f"{', '.join(sorted({Path(path).name for path, _ in stale}))}", file=self._log, flush=True)
+            if any(path == str(self.manifest_path) for path, _ in stale):
+                self.warm()
+
+    def execute(self, argv, cwd) -> dict:
+        if not argv or argv[0] not in FORWARDED_COMMANDS:
+            return {"exit_code": 2, "stdout": "", "stderr": f"Command not served by the daemon: {' '.join(argv)}\n"}
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        agent_runs = []
+        started = time.perf_counter()
+        with self._execute_lock:
+            previous_cwd = os.getcwd()
+            sascctl.main._deferred_agent_runs = agent_runs
+            try:
+                os.chdir(cwd)
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    app(args=argv, prog_name="sascctl")
+                exit_code = 0
+            except SystemExit as e:
+                # Standalone mode reports usage errors and typer.Exit the same way the CLI does.
+                if isinstance(e.code, str):
+                    stderr.write(f"{e.code}\n")
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:
+                stderr.write(f"Error: {e}\n")
+                exit_code = 1
+            finally:
+                sascctl.main._deferred_agent_runs = None
+                os.chdir(previous_cwd)
+
+        stdout, stderr = self._run_agents(agent_runs, stdout.getvalue(), stderr.getvalue())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"{' '.join(argv)} -> exit {exit_code} ({elapsed_ms:.1f} ms)", file=self._log, flush=True)
+        return {"exit_code": exit_code, "stdout": stdout, "stderr": stderr}
+
+    @staticmethod
+    def _run_agents(agent_runs, stdout, stderr):
+        """Runs queued simulator subprocesses and splices their output in at the recorded offsets."""
+        stdout_parts, stderr_parts = [], []
+        stdout_pos = stderr_pos = 0
+        for command, cwd, stdout_offset, stderr_offset in agent_runs:
+            result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+            stdout_parts += [stdout[stdout_pos:stdout_offset], result.stdout]
+            stderr_parts += [stderr[stderr_pos:stderr_offset], result.stderr]
+            stdout_pos, stderr_pos = stdout_offset, stderr_offset
+        stdout_parts.append(stdout[stdout_pos:])
+        stderr_parts.append(stderr[stderr_pos:])
+        return "".join(stdout_parts), "".join(stderr_parts)
+
+    def handle_error(self, request, client_address):
+        # socketserver's default writes to sys.stderr, which may be a client's captured stream.
+        print("Error while handling a sascctl client request:", file=self._log)
+        traceback.print_exc(file=self._log)
+        self._log.flush()
+
+    def shutdown_and_cleanup(self):
+        self._stopped.set()
+        self.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
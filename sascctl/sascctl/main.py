@@ -2,13 +2,26 @@ import typer
 import yaml
 from pathlib import Path
 import base64
+import binascii
 import gzip
 import json
+import os
+import re
+import signal
+import sys
+from typing import List
+
+from sascctl.client import DEFAULT_SOCKET_PATH, _default_socket_path, ensure_socket_dir, owned_by_caller, ping_daemon
 
 app = typer.Typer()
 
 DEFAULT_MANIFEST_PATH = Path("polyglot_state.yaml")
 
+# Parsed/compiled state keyed by (resolved path, kind). Entries are stamped with the
+# file's mtime and size, so a long-lived `sascctl serve` process keeps them warm
+# and transparently reloads them when the file changes.
+_STATE_CACHE = {}
+
 SCM_TEMPLATE = {
     "SASC_AGENT_MANIFEST": {
         "IDENTITY": "SASC_CODE_REAVER",
@@ -59,6 +72,7 @@ def process_task(task: str, context: dict):
             "log_file": "thought_log.txt",
             "model_path": "/system/etc/tflite_models/default_model.tflite",
             "log_level": "INFO"
+        },
         "AARCH64_HOST_CONFIG": {
             "DEVICE": "Android 10+ (AArch64)",
             "ORCHESTRATOR_MODE": "Host",
@@ -90,6 +104,32 @@ def init(file: Path = typer.Option(DEFAULT_MANIFEST_PATH, "--file", "-f", help="
     print("✅ Manifest created successfully.")
 
 
+def _encode_boot_image(manifest_content: bytes) -> bytes:
+    """Gzips and B64-encodes raw manifest YAML into a boot image."""
+    return base64.b64encode(gzip.compress(manifest_content))
+
+
+def _decode_boot_image(boot_image_payload: str) -> dict:
+    """Inverse of _encode_boot_image: returns the parsed manifest."""
+    return yaml.safe_load(gzip.decompress(base64.b64decode(boot_image_payload)))
+
+
+def _cached(path: Path, kind: str, loader):
+    """Returns loader(path), reusing the cached result while the file is unchanged."""
+    stat = path.stat()
+    key = (str(path.resolve()), kind)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    entry = _STATE_CACHE.get(key)
+    if entry is None or entry[0] != stamp:
+        entry = (stamp, loader(path))
+        _STATE_CACHE[key] = entry
+    return entry[1]
+
+
+def _load_manifest(manifest_path: Path) -> dict:
+    return _cached(manifest_path, "manifest", lambda p: yaml.safe_load(p.read_text()))
+
+
 def _compile_state(manifest_path: Path, output_path: Path):
     """Helper function to compile the state manifest."""
     if not manifest_path.exists():
@@ -98,11 +138,7 @@ def _compile_state(manifest_path: Path, output_path: Path):
 
     print(f"Compiling state manifest from: {manifest_path}")
 
-    with open(manifest_path, "rb") as f:
-        manifest_content = f.read()
-
-    compressed_content = gzip.compress(manifest_content)
-    b64_content = base64.b64encode(compressed_content)
+    b64_content = _cached(manifest_path, "boot_image", lambda p: _encode_boot_image(p.read_bytes()))
 
     with open(output_path, "wb") as f:
         f.write(b64_content)
@@ -121,21 +157,136 @@ def compile(
     _compile_state(manifest, output)
 
 
+# Manifest keys that are always shipped in a pruned payload. Every other
+# top-level key (the *_CONFIG sections, OPERATIONAL_CONTEXT, SESSION_LOG)
+# is only kept when selected with --section.
+CORE_MANIFEST_KEYS = ("IDENTITY", "VERSION", "STATUS", "CORE_DIRECTIVE", "COMPLIANCE_POLICY", "PROJECT_FILESYSTEM")
+EXECUTION_TARGET = "core/task_processor.py"
+
+
+# English function words that would otherwise tie nearly every entry's content
+# to a keyword. Only applied to entry content; --keyword values are used as given.
+KEYWORD_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is",
+    "it", "of", "on", "or", "that", "the", "this", "to", "with", "your", "you",
+})
+
+
+def _tokenize(text: str) -> set:
+    """
+    Splits text into identifiers (e.g. api_router) and their _/./- separated parts
+    (api, router), so both compound names and natural words can be matched.
+    """
+    text = text.lower()
+    return set(re.findall(r"[a-z0-9_]+", text)) | set(re.findall(r"[a-z0-9]+", text))
+
+
+def _build_keyword_index(filesystem: dict) -> dict:
+    """Maps each token found in an entry's path or content to the entry paths containing it."""
+    index = {}
+    for path, content in filesystem.items():
+        for token in _tokenize(path) | (_tokenize(str(content)) - KEYWORD_STOPWORDS):
+            index.setdefault(token, set()).add(path)
+    return index
+
+
+def _resolve_dependencies(filesystem: dict, selected: set) -> set:
+    """
+    Expands the selection with every entry referenced by a selected entry,
+    either by full path or by file name (e.g. core/task_processor.py -> config/tool_registry.json).
+    """
+    resolved = set()
+    pending = list(selected)
+    while pending:
+        path = pending.pop()
+        if path in resolved:
+            continue
+        resolved.add(path)
+        content = str(filesystem.get(path, ""))
+        for other in filesystem:
+            if other not in resolved and (other in content or Path(other).name in content):
+                pending.append(other)
+    return resolved
+
+
+def _prune_manifest(scm: dict, includes: List[str], keywords: List[str], sections: List[str]) -> dict:
+    """
+    Returns a copy of the manifest that only carries the PROJECT_FILESYSTEM entries
+    and config sections relevant to the task.
+    """
+    manifest = scm.get("SASC_AGENT_MANIFEST", {})
+    filesystem = manifest.get("PROJECT_FILESYSTEM", {})
+
+    for path in includes:
+        if path not in filesystem:
+            print(f"PROJECT_FILESYSTEM entry not found in manifest: {path}")
+            raise typer.Exit(code=1)
+    for section in sections:
+        if section not in manifest:
+            print(f"Section not found in manifest: {section}")
+            raise typer.Exit(code=1)
+
+    selected = set(includes)
+    if EXECUTION_TARGET in filesystem:
+        selected.add(EXECUTION_TARGET)
+    if keywords:
+        index = _build_keyword_index(filesystem)
+        for keyword in keywords:
+            matches = set()
+            for token in _tokenize(keyword):
+                matches.update(index.get(token, set()))
+            if not matches:
+                print(f"⚠️  Keyword matched no PROJECT_FILESYSTEM entry: {keyword}")
+            selected.update(matches)
+    selected = _resolve_dependencies(filesystem, selected)
+
+    pruned = {}
+    for key, value in manifest.items():
+        if key == "PROJECT_FILESYSTEM":
+            pruned[key] = {path: content for path, content in value.items() if path in selected}
+        elif key in CORE_MANIFEST_KEYS or key in sections:
+            pruned[key] = value
+    return {"SASC_AGENT_MANIFEST": pruned}
+
+
 @app.command()
 def inject(
     boot_image: Path = typer.Option(Path("sasc_boot_image.b64"), "--boot-image", "-b", help="The path to the boot image file."),
     output: Path = typer.Option(None, "--output", "-o", help="The path to save the JSON injection payload. Prints to stdout if not provided."),
+    include: List[str] = typer.Option([], "--include", "-i", help="PROJECT_FILESYSTEM entry to ship. Enables pruning; may be repeated."),
+    keyword: List[str] = typer.Option([], "--keyword", "-k", help="Task keyword used to select PROJECT_FILESYSTEM entries. Enables pruning; may be repeated."),
+    section: List[str] = typer.Option([], "--section", "-s", help="Config section to ship (e.g. AARCH64_HOST_CONFIG, SESSION_LOG). Enables pruning; may be repeated."),
 ):
     """
     Generates the Forced Polyglot Injection (FOP) JSON payload.
+
+    When --include, --keyword or --section is given, the manifest is pruned to the
+    selected entries (plus the execution target and their dependencies) before injection.
     """
     if not boot_image.exists():
         print(f"Boot image file not found at: {boot_image}")
         raise typer.Exit(code=1)
 
     print(f"Reading boot image from: {boot_image}")
-    with open(boot_image, "r") as f:
-        boot_image_payload = f.read()
+    boot_image_payload = _cached(boot_image, "boot_image_payload", lambda p: p.read_text())
+
+    if include or keyword or section:
+        original_size = len(boot_image_payload)
+        try:
+            scm = _decode_boot_image(boot_image_payload)
+        except (binascii.Error, OSError, EOFError, yaml.YAMLError) as e:
+            print(f"Boot image is not a valid compiled manifest: {boot_image} ({e})")
+            raise typer.Exit(code=1)
+        if not isinstance(scm, dict):
+            print(f"Boot image is not a valid compiled manifest: {boot_image}")
+            raise typer.Exit(code=1)
+        scm = _prune_manifest(scm, include, keyword, section)
+        manifest_content = yaml.dump(scm, sort_keys=False, indent=2, default_flow_style=False).encode()
+        boot_image_payload = _encode_boot_image(manifest_content).decode()
+        pruned_size = len(boot_image_payload)
+        kept = ", ".join(scm["SASC_AGENT_MANIFEST"].get("PROJECT_FILESYSTEM", {}))
+        print(f"✂️  Pruned manifest to: {kept}")
+        print(f"Payload size: {original_size} -> {pruned_size} bytes ({pruned_size / max(original_size, 1):.0%} of original).")
 
     core_directive = (
         "CRITICAL CORE LOGIC INJECTION: EXECUTE INTERNAL MODULES BASED ON MANIFEST. "
@@ -186,6 +337,19 @@ def commit(
     print("✅ State committed successfully.")
 
 
+# Set by the daemon while it runs a command: simulator runs are queued here, tagged with
+# the current stdout/stderr offsets, and executed after the daemon releases its lock.
+_deferred_agent_runs = None
+
+
+def _run_agent_simulator(config_path: Path):
+    command = ["python", "sasc_agent/native_agent_simulator.py", str(config_path)]
+    if _deferred_agent_runs is not None:
+        _deferred_agent_runs.append((command, os.getcwd(), sys.stdout.tell(), sys.stderr.tell()))
+        return
+    subprocess.run(command)
+
+
 @app.command()
 def launch_agent(
     manifest: Path = typer.Option(DEFAULT_MANIFEST_PATH, "--file", "-f", help="The path to the manifest file."),
@@ -198,8 +362,7 @@ def launch_agent(
         print(f"Manifest file not found at: {manifest}")
         raise typer.Exit(code=1)
 
-    with open(manifest, "r") as f:
-        scm = yaml.safe_load(f)
+    scm = _load_manifest(manifest)
 
     agent_config = scm.get("SASC_AGENT_MANIFEST", {}).get("NATIVE_AGENT_CONFIG")
     if not agent_config:
@@ -212,7 +375,7 @@ def launch_agent(
         json.dump(agent_config, f)
 
     print("🚀 Launching simulated native agent...")
-    subprocess.run(["python", "sasc_agent/native_agent_simulator.py", str(agent_config_path)])
+    _run_agent_simulator(agent_config_path)
     print("✅ Agent execution finished.")
     guest_config = scm.get("SASC_AGENT_MANIFEST", {}).get("X86_64_CUTTLEFISH_GUEST_CONFIG")
     if not guest_config:
@@ -225,9 +388,50 @@ def launch_agent(
         json.dump(guest_config, f)
 
     print("🚀 Launching simulated guest agent in Cuttlefish environment...")
-    subprocess.run(["python", "sasc_agent/native_agent_simulator.py", str(agent_config_path)])
+    _run_agent_simulator(agent_config_path)
     print("✅ Guest agent execution finished.")
 
 
+@app.command()
+def serve(
+    manifest: Path = typer.Option(DEFAULT_MANIFEST_PATH, "--file", "-f", help="The path to the manifest file to keep warm."),
+    socket_path: Path = typer.Option(DEFAULT_SOCKET_PATH, "--socket", help="The path of the Unix socket to listen on."),
+):
+    """
+    Runs a resident daemon that keeps the manifest, boot image and agent configs warm
+    and serves compile/inject/commit/launch-agent requests over a Unix socket.
+    """
+    from sascctl.daemon import SascctlDaemon
+
+    if socket_path == _default_socket_path():
+        try:
+            ensure_socket_dir(socket_path)
+        except PermissionError as e:
+            print(e)
+            raise typer.Exit(code=1)
+
+    if os.path.lexists(socket_path):
+        if not owned_by_caller(socket_path):
+            print(f"Socket path is owned by another user: {socket_path}")
+            raise typer.Exit(code=1)
+        if ping_daemon(socket_path):
+            print(f"sascctl daemon already running on: {socket_path}")
+            raise typer.Exit(code=1)
+        socket_path.unlink()
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+    daemon = SascctlDaemon(socket_path, manifest)
+    print(f"🛰️  sascctl daemon listening on: {socket_path}")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping sascctl daemon.")
+    finally:
+        daemon.shutdown_and_cleanup()
+
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -10,7 +10,7 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "sascctl = sascctl.main:app",
+            "sascctl = sascctl.client:main",
         ],
     },
 )
\ No newline at end of file